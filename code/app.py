@@ -8,33 +8,28 @@ This includes core functionality:
 """
 
 import concurrent.futures
-import os
-import time
-import traceback
 
 import streamlit as st
-from dotenv import load_dotenv
 from file_search_service import (
     ClearStoreResult,
     DocumentInfo,
-    UploadResult,
     clear_store,
     get_or_create_store,
     list_store_documents,
-    upload_single_file,
+    upload_files_parallel,
 )
 from google import genai
 from google.genai import types
-
-load_dotenv()
+from ui import bootstrap, handle_chat_prompt
 
 st.set_page_config(page_title="Gemini File Search - use GUI", layout="wide")
 st.title("🔍 Gemini File Search - use GUI")
 
 # Configuration
-api_key = os.getenv("GEMINI_API_KEY")
-model_name = os.getenv("USE_MODEL", "gemini-2.5-flash")
-store_display_name = os.getenv("FILE_SEARCH_STORE", "demo_filesearch_store")
+settings = bootstrap()
+api_key = settings.api_key
+model_name = settings.model
+store_display_name = settings.store
 
 if not api_key:
     st.error("Set GEMINI_API_KEY in your environment before running the app.")
@@ -44,39 +39,91 @@ st.sidebar.success("API key loaded.")
 st.sidebar.info(f"Using model: `{model_name}`")
 
 # Initialize client and file search store
-if "client" not in st.session_state:
-    st.session_state.client = genai.Client(api_key=api_key)
-
-client: genai.Client = st.session_state.client
+client: genai.Client = settings.client
 
-if "store_name" not in st.session_state:
-    st.session_state.store_name = get_or_create_store(client, store_display_name)
+# Resolved on every rerun (a cache hit after the first) so a store deleted
+# elsewhere, which the service forgets on NOT_FOUND, is replaced right away
+st.session_state.store_name = get_or_create_store(client, store_display_name)
 
 store_name = st.session_state.store_name
 st.sidebar.success(f"Using store: `{store_name}`")
 
-# Check for existing documents in the store
-existing_docs: list[DocumentInfo] = list_store_documents(client, store_name)
-st.session_state.existing_doc_names = {doc.display_name for doc in existing_docs}
+# Build the File Search generation config once per store rather than per chat turn
+if st.session_state.get("gc_config_store") != store_name:
+    st.session_state.gc_config = types.GenerateContentConfig(
+        tools=[
+            types.Tool(
+                file_search=types.FileSearch(file_search_store_names=[store_name])
+            )
+        ]
+    )
+    st.session_state.gc_config_store = store_name
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_list_docs(store_name: str) -> list[DocumentInfo]:
+    """List store documents, cached across reruns.
+
+    The client is read from the bootstrap resource because genai.Client is not
+    hashable.
+    """
+    return list_store_documents(bootstrap().client, store_name)
+
+
+def _doc_name_key(name: str) -> str:
+    """Normalize a document name so case/whitespace variants count as duplicates."""
+    return name.casefold().strip()
+
+
+# Check for existing documents in the store. Listing errors propagate out of
+# the cached function (so they are not cached) and are shown here instead of
+# breaking the page; the store's contents are then unknown, not empty.
+listing_failed = False
+try:
+    existing_docs: list[DocumentInfo] = _cached_list_docs(store_name)
+except Exception as exc:
+    st.sidebar.error(f"Could not list store documents: {exc}")
+    existing_docs = []
+    listing_failed = True
+st.session_state.existing_doc_names = {
+    _doc_name_key(doc.display_name) for doc in existing_docs
+}
 
 # Display existing documents info and set files_ready state
 if existing_docs:
     st.sidebar.subheader(f"📄 Store Contents ({len(existing_docs)} document(s))")
+    lines = []
     for doc in existing_docs:
         # Show document name, truncate if too long
         doc_name = doc.display_name
         if len(doc_name) > 40:
             doc_name = doc_name[:37] + "..."
-        state_icon = "✅" if doc.state == "ACTIVE" else "⏳"
-        st.sidebar.text(f"{state_icon} {doc_name}")
+        state_icon = "✅" if doc.state is types.DocumentState.STATE_ACTIVE else "⏳"
+        lines.append(f"{state_icon} {doc_name}")
+    # Render the whole list as one element instead of one delta per document
+    st.sidebar.text("\n".join(lines))
 
     # Enable chat if documents exist (always set based on current store state)
     st.session_state.files_ready = True
-else:
+elif not listing_failed:
     st.sidebar.info("Store is empty. Upload documents to get started.")
     # Disable chat if no documents exist
     st.session_state.files_ready = False
 
+# Maximum number of concurrent uploads; bounded by API concurrency, not batch size
+UPLOAD_MAX_WORKERS = 8
+# Seconds between upload status refreshes while indexing is pending
+UPLOAD_STATUS_INTERVAL = 10.0
+
+
+@st.cache_resource
+def _get_upload_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the long-lived thread pool shared by all upload batches."""
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=UPLOAD_MAX_WORKERS, thread_name_prefix="gemini-upload"
+    )
+
+
 # Upload & index documents
 st.sidebar.subheader("Upload documents")
 uploaded_files = st.sidebar.file_uploader(
@@ -102,17 +149,22 @@ def upload_files(files, skip_duplicates: bool = True):
     failures = 0
     skipped = 0
 
-    # Filter out files that already exist
+    # Filter out files that already exist, using the in-memory name set rather
+    # than a per-file API lookup
+    existing_names: set[str] = st.session_state.get("existing_doc_names", set())
     files_to_upload = []
     if skip_duplicates:
         for uploaded_file in files:
-            if uploaded_file.name in st.session_state.get("existing_doc_names", set()):
+            key = _doc_name_key(uploaded_file.name)
+            if key in existing_names:
                 st.sidebar.warning(
                     f"⏭️ **{uploaded_file.name}** - Already exists (skipped)."
                 )
                 skipped += 1
             else:
                 files_to_upload.append(uploaded_file)
+                # Also suppress repeats of the same name within this batch
+                existing_names.add(key)
     else:
         files_to_upload = files
 
@@ -120,34 +172,47 @@ def upload_files(files, skip_duplicates: bool = True):
         st.sidebar.info("No new files to upload.")
         return
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_file = {
-            executor.submit(
-                upload_single_file, client, store_name, uploaded_file
-            ): uploaded_file
-            for uploaded_file in files_to_upload
-        }
-
-        for future in concurrent.futures.as_completed(future_to_file):
-            uploaded_file = future_to_file[future]
-            try:
-                result: UploadResult = future.result()
-                if result.success:
-                    st.sidebar.success(
-                        f"✅ **{uploaded_file.name}** - Uploaded successfully."
-                    )
-                    successes += 1
-                else:
-                    st.sidebar.error(
-                        f"❌ **{uploaded_file.name}** - {result.error_message}"
-                    )
-                    failures += 1
-            except Exception as exc:
-                st.sidebar.error(
-                    f"❌ **{uploaded_file.name}** - Generated an exception: {exc}"
+    # Live status container: each result is written as its upload completes and
+    # the label reports elapsed time while indexing is still pending
+    total = len(files_to_upload)
+    completed = 0
+    with st.sidebar.status(f"Indexing 0/{total} file(s)…", expanded=True) as status:
+        progress = status.progress(0.0)
+
+        def show_progress(elapsed: float) -> None:
+            status.update(
+                label=f"Indexing {completed}/{total} file(s)… ({elapsed:.0f}s elapsed)"
+            )
+
+        for result in upload_files_parallel(
+            client,
+            store_name,
+            files_to_upload,
+            executor=_get_upload_pool(),
+            status_callback=show_progress,
+            status_interval=UPLOAD_STATUS_INTERVAL,
+        ):
+            completed += 1
+            progress.progress(completed / total)
+            if result.deduped:
+                status.info(
+                    f"⏭️ **{result.file_name}** - Identical content "
+                    "already indexed (skipped)."
                 )
+                skipped += 1
+            elif result.success:
+                status.success(f"✅ **{result.file_name}** - Uploaded successfully.")
+                existing_names.add(_doc_name_key(result.file_name))
+                successes += 1
+            else:
+                status.error(f"❌ **{result.file_name}** - {result.error_message}")
                 failures += 1
 
+        status.update(
+            label=f"Indexed {successes}/{total} file(s)",
+            state="complete" if failures == 0 else "error",
+        )
+
     # Show summary
     if successes > 0:
         st.session_state.files_ready = True
@@ -158,6 +223,7 @@ def upload_files(files, skip_duplicates: bool = True):
             summary_parts.append(f"⏭️ {skipped} skipped")
         st.sidebar.info(f"Upload complete: {', '.join(summary_parts)}")
         # Refresh to show updated document list in sidebar
+        _cached_list_docs.clear()
         st.rerun()
     else:
         if skipped > 0 and failures == 0:
@@ -172,162 +238,81 @@ def upload_files(files, skip_duplicates: bool = True):
 if st.sidebar.button("Upload & index") and uploaded_files:
     upload_files(uploaded_files)
 
-# Clear store
-if st.sidebar.button("Clear store"):
+# Clear store (disabled when there is nothing to delete, saving the round trip)
+if st.sidebar.button("Clear store", disabled=not (existing_docs or listing_failed)):
     result: ClearStoreResult = clear_store(client, store_name)
 
     if result.deleted:
+        # clear_store forgets the cached store name, so get_or_create_store
+        # creates a fresh store on the next run
         st.sidebar.success("Store cleared successfully.")
-        # Remove the store name from the session state to create a new one on next run
-        if "store_name" in st.session_state:
-            del st.session_state.store_name
     elif result.errors:
         st.sidebar.error(f"Errors: {', '.join(result.errors)}")
     else:
         st.sidebar.info("Store is already empty or could not be deleted.")
 
     # Refresh the page to update the document list
+    _cached_list_docs.clear()
     st.rerun()
 
 
-def handle_chat_prompt(
-    prompt: str, client: genai.Client, model_name: str, store_name: str
-):
-    """Handles the user's chat prompt, generates a response, and updates the chat history."""
-    st.session_state.chat_history.append({"role": "user", "content": prompt})
-    with st.chat_message("user"):
-        st.markdown(prompt)
-
-    with st.chat_message("assistant"):
-        answer = None
-        citations = None
-        response = None
-
-        with st.spinner("Thinking…"):
-            try:
-                response = client.models.generate_content(
-                    model=model_name,
-                    contents=[
-                        types.Content(
-                            role="user",
-                            parts=[types.Part(text=prompt)],
-                        )
-                    ],
-                    config=types.GenerateContentConfig(
-                        tools=[
-                            types.Tool(
-                                file_search=types.FileSearch(
-                                    file_search_store_names=[store_name]
-                                )
-                            )
-                        ]
-                    ),
-                )
-            except Exception as e:
-                error_msg = f"Error generating response: {str(e)}"
-                answer = error_msg
-                st.error(error_msg)
-
-        # Safely extract the answer from the response (if we got one)
-        if response is not None:
-            try:
-                if (
-                    not hasattr(response, "candidates")
-                    or not response.candidates
-                    or len(response.candidates) == 0
-                ):
-                    answer = "Error: No candidates in the response."
-                else:
-                    candidate = response.candidates[0]
-
-                    # Check for finish reason (blocked content, etc.)
-                    finish_reason = getattr(candidate, "finish_reason", None)
-                    if finish_reason:
-                        finish_reason_str = str(finish_reason)
-                        if (
-                            "SAFETY" in finish_reason_str.upper()
-                            or "BLOCKED" in finish_reason_str.upper()
-                        ):
-                            answer = (
-                                "Error: The response was blocked for safety reasons."
-                            )
-                        elif "OTHER" in finish_reason_str.upper():
-                            answer = (
-                                "Error: The response was blocked for other reasons."
-                            )
-
-                    # Try to extract text content (only if we haven't already set an error)
-                    if answer is None:
-                        if not hasattr(candidate, "content") or not candidate.content:
-                            answer = "Error: Response candidate has no content."
-                        elif (
-                            not hasattr(candidate.content, "parts")
-                            or not candidate.content.parts
-                            or len(candidate.content.parts) == 0
-                        ):
-                            answer = "Error: Response has no content parts."
-                        else:
-                            # Check if it's text content
-                            first_part = candidate.content.parts[0]
-                            if hasattr(first_part, "text") and first_part.text:
-                                answer = first_part.text
-                            else:
-                                answer = (
-                                    "Error: Response does not contain text content."
-                                )
-
-                    # Extract citations if available
-                    citations = getattr(candidate, "citation_metadata", None)
-
-            except Exception as e:
-                answer = f"Error parsing response: {str(e)}"
-                st.error(f"Details: {traceback.format_exc()}")
-        elif answer is None:
-            answer = "Error: No response received from the model."
-
-        # Display the answer or error
-        if answer:
-            st.markdown(answer)
-
-            # Display citations if available
-            if citations and hasattr(citations, "citations") and citations.citations:
-                st.markdown("**Citations**")
-                for citation in citations.citations:
-                    label = (
-                        getattr(citation, "title", None)
-                        or getattr(citation, "uri", None)
-                        or "Source"
-                    )
-                    uri = getattr(citation, "uri", None)
-                    if uri:
-                        st.markdown(f"- [{label}]({uri})")
-                    else:
-                        st.markdown(f"- {label}")
-        else:
-            st.error("Error: Unable to extract answer from the response.")
-            answer = "Error: Unable to extract answer from the response."
-
-    if answer:
-        st.session_state.chat_history.append({"role": "assistant", "content": answer})
-
-
 # Chat interface
 st.markdown("Upload documents in the sidebar, then ask questions below.")
 
 if "chat_history" not in st.session_state:
+    # Turns sent to the model as context
     st.session_state.chat_history = []
+if "chat_log" not in st.session_state:
+    # Everything shown in the chat, including error replies
+    st.session_state.chat_log = []
 
-for message in st.session_state.chat_history:
-    with st.chat_message(message["role"]):
-        st.markdown(message["content"])
+# Number of most recent messages rendered as individual chat bubbles
+CHAT_BUBBLE_LIMIT = 20
 
-prompt = st.chat_input(
-    "Ask a question about the uploaded documents…",
-    disabled=not st.session_state.get("files_ready", False),
-)
 
-if not st.session_state.get("files_ready", False):
-    st.info("Upload and index documents (PDF or TXT) to enable questions.")
+@st.fragment
+def chat_area():
+    """Render the chat history and input.
+
+    As a fragment, sending a message reruns only this function instead of the
+    whole script (sidebar, store listing), and sidebar actions still redraw it.
+    Inside a fragment the chat input is drawn inline, so messages (including
+    the turn being answered) go into a container placed above it.
+    """
+    history = st.session_state.chat_log
+    recent = history[-CHAT_BUBBLE_LIMIT:]
+    older = history[: len(history) - len(recent)]
+    messages = st.container()
+
+    # Collapse older turns into one markdown element; only recent turns get
+    # their own chat bubble (one container per message)
+    if older:
+        with messages.expander(f"Earlier messages ({len(older)})"):
+            st.markdown(
+                "\n\n".join(
+                    f"**{'Assistant' if m.role == 'model' else 'You'}:** "
+                    f"{m.parts[0].text}"
+                    for m in older
+                )
+            )
+
+    for message in recent:
+        with messages.chat_message("assistant" if message.role == "model" else "user"):
+            st.markdown(message.parts[0].text)
+
+    files_ready = st.session_state.get("files_ready", False)
+    prompt = st.chat_input(
+        "Ask a question about the uploaded documents…",
+        disabled=not files_ready,
+    )
+
+    if not files_ready:
+        st.info("Upload and index documents (PDF or TXT) to enable questions.")
+
+    if prompt:
+        handle_chat_prompt(
+            prompt, client, model_name, st.session_state.gc_config, messages
+        )
+
 
-if prompt:
-    handle_chat_prompt(prompt, client, model_name, store_name)
+chat_area()
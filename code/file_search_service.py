@@ -2,27 +2,71 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import io
+import json
+import logging
+import operator
 import os
+import pathlib
+import random
+import shutil
 import tempfile
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional
 
+import httpx
 from google import genai
 from google.genai import errors as genai_errors
 from google.genai import types
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Connection pool sized for the app's concurrent uploads plus chat requests
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+
+@functools.lru_cache(maxsize=1)
+def get_client(api_key: Optional[str] = None) -> genai.Client:
+    """Return a shared google-genai client for api_key.
+
+    Callers should obtain clients through this factory: reusing one client
+    keeps its keep-alive HTTP connections (and their TLS sessions) warm across
+    uploads, listings and chat requests instead of re-negotiating per client.
+
+    Args:
+        api_key: Gemini API key; if None the SDK reads it from the environment.
+
+    Returns:
+        A genai.Client whose sync and async HTTP clients use a bounded pool.
+    """
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(
+            client_args={"limits": _HTTP_LIMITS},
+            async_client_args={"limits": _HTTP_LIMITS},
+        ),
+    )
+
+
+@dataclass(slots=True)
 class UploadResult:
     """Result of uploading a single file."""
 
     file_name: str
     success: bool
     error_message: Optional[str] = None
+    skipped: bool = False
+    # True when identical content was already in the store and nothing was sent
+    deduped: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ClearStoreResult:
     """Result of clearing a store."""
 
@@ -30,24 +74,192 @@ class ClearStoreResult:
     errors: list[str] = None
 
 
+# Seconds a resolved display_name -> store name mapping stays valid; long,
+# since stores persist for the life of the project, but bounded so deleted
+# stores eventually fall out
+STORE_NAME_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def _default_cache_path(file_name: str) -> str:
+    """Return a file in the per-user cache directory used to persist lookups."""
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_root, "gemini-file-search", file_name)
+
+
+def _write_json_atomic(path: str, data: Any) -> None:
+    """Write data as JSON to path via a temp file, ignoring filesystem errors."""
+    cache_dir = os.path.dirname(path)
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+        # Replace in one step so readers never see a partially written file
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path:
+            _remove_temp_file(tmp_path)
+
+
+# On-disk copy of the store name cache, so cold starts skip the list round
+# trip; set to None to keep the cache in memory only
+STORE_CACHE_PATH: Optional[str] = _default_cache_path("stores.json")
+
+
+def _load_store_cache() -> dict[str, tuple[str, float]]:
+    """Read unexpired persisted mappings, ignoring a missing or corrupt file."""
+    if not STORE_CACHE_PATH:
+        return {}
+    try:
+        with open(STORE_CACHE_PATH, encoding="utf-8") as fh:
+            raw = json.load(fh)
+        entries = {str(k): (str(v[0]), float(v[1])) for k, v in raw.items()}
+    except (OSError, ValueError, TypeError, LookupError, AttributeError):
+        return {}
+
+    now = time.time()
+    return {
+        display_name: entry
+        for display_name, entry in entries.items()
+        if now - entry[1] < STORE_NAME_CACHE_TTL_SECONDS
+    }
+
+
+def _save_store_cache() -> None:
+    """Atomically write the store name cache to disk; the caller holds the lock."""
+    if STORE_CACHE_PATH:
+        _write_json_atomic(
+            STORE_CACHE_PATH, {k: list(v) for k, v in _STORE_NAME_CACHE.items()}
+        )
+
+
+# Process-wide cache of "<account fingerprint>:<display_name>" ->
+# (store name, time.time() resolved), seeded from disk at import
+_STORE_NAME_CACHE: dict[str, tuple[str, float]] = _load_store_cache()
+_STORE_NAME_CACHE_LOCK = threading.Lock()
+# Store names confirmed to exist by this process; persisted hits are checked
+# once before being trusted
+_VERIFIED_STORE_NAMES: set[str] = set()
+
+
+def _is_not_found(exc: BaseException) -> bool:
+    """Return True if exc is an API error reporting a missing resource."""
+    return isinstance(exc, genai_errors.APIError) and exc.code == 404
+
+
+def _account_fingerprint(client: genai.Client) -> str:
+    """Return a short, non-reversible tag for the client's API key or project.
+
+    Store names belong to one account, so cached mappings are keyed by this to
+    keep another key's or project's stores from being reused.
+    """
+    api_client = getattr(client, "_api_client", None)
+    identity = "|".join(
+        str(getattr(api_client, attr, None) or "")
+        for attr in ("api_key", "project", "location")
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:16]
+
+
+def _store_exists(client: genai.Client, store_name: str) -> bool:
+    """Confirm store_name still exists; errors other than not-found count as yes."""
+    try:
+        client.file_search_stores.get(name=store_name)
+    except Exception as exc:
+        if _is_not_found(exc):
+            return False
+        logger.debug("Checking store %s failed", store_name, exc_info=True)
+    return True
+
+
 def get_or_create_store(client: genai.Client, display_name: str) -> str:
-    """Return the store name matching display_name or create it."""
+    """Return the store name matching display_name or create it.
+
+    Resolved names are cached in memory and in STORE_CACHE_PATH for
+    STORE_NAME_CACHE_TTL_SECONDS, keyed by the client's account, so repeat
+    lookups and app restarts skip the list round trip. A name loaded from disk
+    is confirmed with one get call per process, and dropped if the store is
+    gone.
+    """
+    cache_key = f"{_account_fingerprint(client)}:{display_name}"
+    with _STORE_NAME_CACHE_LOCK:
+        cached = _STORE_NAME_CACHE.get(cache_key)
+        verified = cached is not None and cached[0] in _VERIFIED_STORE_NAMES
+    if cached and time.time() - cached[1] < STORE_NAME_CACHE_TTL_SECONDS:
+        store_name = cached[0]
+        if verified:
+            return store_name
+        if _store_exists(client, store_name):
+            with _STORE_NAME_CACHE_LOCK:
+                # Only mark it verified if it wasn't forgotten meanwhile
+                still_cached = _STORE_NAME_CACHE.get(cache_key) == cached
+                if still_cached:
+                    _VERIFIED_STORE_NAMES.add(store_name)
+            if still_cached:
+                return store_name
+        else:
+            _forget_store_name(store_name)
+
+    store_name = None
     stores = client.file_search_stores.list()
     for store in stores:
         if store.display_name == display_name:
-            return store.name
+            store_name = store.name
+            break
+
+    if store_name is None:
+        created = client.file_search_stores.create(
+            config={"display_name": display_name}
+        )
+        store_name = created.name
+
+    with _STORE_NAME_CACHE_LOCK:
+        _STORE_NAME_CACHE[cache_key] = (store_name, time.time())
+        _VERIFIED_STORE_NAMES.add(store_name)
+        _save_store_cache()
+    return store_name
+
 
-    created = client.file_search_stores.create(config={"display_name": display_name})
-    return created.name
+def _forget_store_name(store_name: str) -> None:
+    """Drop cached display_name mappings that resolve to store_name."""
+    with _STORE_NAME_CACHE_LOCK:
+        _VERIFIED_STORE_NAMES.discard(store_name)
+        for cache_key, (cached_name, _) in list(_STORE_NAME_CACHE.items()):
+            if cached_name == store_name:
+                del _STORE_NAME_CACHE[cache_key]
+        _save_store_cache()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DocumentInfo:
     """Information about a document in the store."""
 
     name: str
     display_name: str
-    state: Optional[str] = None
+    state: Optional[types.DocumentState] = None
+
+    @property
+    def state_name(self) -> str:
+        """State as a plain string (e.g. "STATE_ACTIVE"), or "UNKNOWN"."""
+        return getattr(self.state, "name", None) or "UNKNOWN"
+
+
+# Fields copied from an SDK Document into DocumentInfo, fetched in one call
+_DOC_FIELDS = operator.attrgetter("name", "display_name", "state")
+
+
+def _to_document_info(doc: types.Document) -> DocumentInfo:
+    """Convert an SDK Document into a DocumentInfo."""
+    name, display_name, state = _DOC_FIELDS(doc)
+    return DocumentInfo(name=name, display_name=display_name, state=state)
+
+
+# documents.list returns 10 documents per page unless asked for more; 20 is
+# the API's per-page maximum, so full listings take half the round trips
+_LIST_DOCUMENTS_CONFIG = {"page_size": 20}
 
 
 def list_store_documents(client: genai.Client, store_name: str) -> list[DocumentInfo]:
@@ -58,23 +270,77 @@ def list_store_documents(client: genai.Client, store_name: str) -> list[Document
         store_name: Fully qualified File Search store name.
 
     Returns:
-        List of DocumentInfo objects describing each document in the store.
+        List of DocumentInfo objects describing each document in the store;
+        empty if the store no longer exists.
+
+    Raises:
+        Exception: Any other listing error, so callers that cache the result
+            don't mistake a transient failure for an empty store.
     """
-    documents = []
     try:
-        for doc in client.file_search_stores.documents.list(parent=store_name):
-            documents.append(
-                DocumentInfo(
-                    name=getattr(doc, "name", ""),
-                    display_name=getattr(doc, "display_name", "Unknown"),
-                    state=str(getattr(doc, "state", "UNKNOWN")),
-                )
-            )
+        pager = client.file_search_stores.documents.list(
+            parent=store_name, config=_LIST_DOCUMENTS_CONFIG
+        )
+    except Exception as exc:
+        if not _is_not_found(exc):
+            raise
+        # The store was deleted elsewhere; resolve it afresh next time
+        logger.debug("Store %s not found while listing", store_name, exc_info=True)
+        _forget_store_name(store_name)
+        return []
+    return [_to_document_info(doc) for doc in pager]
+
+
+# Per-store index of display_name -> DocumentInfo, built from one list pass
+_DOC_INDEX: dict[str, dict[str, DocumentInfo]] = {}
+_DOC_INDEX_LOCK = threading.Lock()
+
+
+def _load_doc_index(client: genai.Client, store_name: str) -> dict[str, DocumentInfo]:
+    """Return the display_name index for a store, listing the store on first use.
+
+    If the list call fails, an empty index is returned without being cached,
+    so the next lookup tries again.
+    """
+    with _DOC_INDEX_LOCK:
+        index = _DOC_INDEX.get(store_name)
+    if index is not None:
+        return index
+
+    try:
+        pager = client.file_search_stores.documents.list(
+            parent=store_name, config=_LIST_DOCUMENTS_CONFIG
+        )
     except Exception:
-        # If listing fails, return empty list
-        pass
+        logger.debug("Listing documents in %s failed", store_name, exc_info=True)
+        return {}
+
+    index = {}
+    for doc in pager:
+        document = _to_document_info(doc)
+        # Keep the first match, as the previous linear scans did
+        index.setdefault(document.display_name, document)
+
+    with _DOC_INDEX_LOCK:
+        return _DOC_INDEX.setdefault(store_name, index)
+
+
+def _index_document(store_name: str, document: DocumentInfo) -> None:
+    """Record a new document in the store's index if the index is loaded."""
+    with _DOC_INDEX_LOCK:
+        index = _DOC_INDEX.get(store_name)
+        if index is not None:
+            index[document.display_name] = document
 
-    return documents
+
+def refresh_doc_index(store_name: str) -> None:
+    """Discard the cached document index so the next lookup re-lists the store.
+
+    Args:
+        store_name: Fully qualified File Search store name.
+    """
+    with _DOC_INDEX_LOCK:
+        _DOC_INDEX.pop(store_name, None)
 
 
 def document_exists(
@@ -82,6 +348,10 @@ def document_exists(
 ) -> Optional[DocumentInfo]:
     """Check if a document with the given display name already exists in the store.
 
+    Lookups are served from a per-store index that is listed once and kept up
+    to date by uploads and deletes made through this module; call
+    refresh_doc_index() to pick up changes made elsewhere.
+
     Args:
         client: google-genai client instance.
         store_name: Fully qualified File Search store name.
@@ -90,18 +360,164 @@ def document_exists(
     Returns:
         DocumentInfo if a document with the same display_name exists, None otherwise.
     """
+    return _load_doc_index(client, store_name).get(display_name)
+
+
+# On-disk copy of the content hash index; set to None to keep it in memory only
+CONTENT_INDEX_PATH: Optional[str] = _default_cache_path("content.json")
+
+# Seconds a content hash -> document mapping is kept. Hits are confirmed with
+# documents.get anyway; this bounds the file for stores deleted elsewhere.
+CONTENT_INDEX_TTL_SECONDS = 30 * 24 * 60 * 60
+
+
+def _prune_content_index(
+    index: dict[str, dict[str, tuple[str, float]]], now: float
+) -> None:
+    """Drop expired mappings, and stores left with none, from index in place."""
+    for store_name, hashes in list(index.items()):
+        for content_hash, (_, recorded) in list(hashes.items()):
+            if now - recorded >= CONTENT_INDEX_TTL_SECONDS:
+                del hashes[content_hash]
+        if not hashes:
+            del index[store_name]
+
+
+def _load_content_index() -> dict[str, dict[str, tuple[str, float]]]:
+    """Read unexpired persisted mappings, ignoring a missing or corrupt file."""
+    if not CONTENT_INDEX_PATH:
+        return {}
     try:
-        for doc in client.file_search_stores.documents.list(parent=store_name):
-            if getattr(doc, "display_name", "") == display_name:
-                return DocumentInfo(
-                    name=getattr(doc, "name", ""),
-                    display_name=getattr(doc, "display_name", "Unknown"),
-                    state=str(getattr(doc, "state", "UNKNOWN")),
-                )
-    except Exception:
-        pass
+        with open(CONTENT_INDEX_PATH, encoding="utf-8") as fh:
+            raw = json.load(fh)
+        index = {
+            str(store): {
+                str(h): (str(entry[0]), float(entry[1]))
+                for h, entry in hashes.items()
+            }
+            for store, hashes in raw.items()
+        }
+    except (OSError, ValueError, TypeError, LookupError, AttributeError):
+        return {}
 
-    return None
+    _prune_content_index(index, time.time())
+    return index
+
+
+# Per-store index of content SHA-256 -> (document name, time.time() recorded),
+# so re-uploading identical bytes (under any display name) can skip the upload
+_CONTENT_HASH_INDEX: dict[str, dict[str, tuple[str, float]]] = _load_content_index()
+_CONTENT_HASH_INDEX_LOCK = threading.Lock()
+# Bumped on every change; lets a slow writer skip a snapshot already superseded
+_content_index_version = 0
+_content_index_saved_version = 0
+_CONTENT_INDEX_WRITE_LOCK = threading.Lock()
+
+
+def _snapshot_content_index() -> tuple[int, dict[str, dict[str, list]]]:
+    """Copy the index for writing; the caller holds _CONTENT_HASH_INDEX_LOCK."""
+    global _content_index_version
+    _content_index_version += 1
+    snapshot = {
+        store_name: {h: list(entry) for h, entry in hashes.items()}
+        for store_name, hashes in _CONTENT_HASH_INDEX.items()
+    }
+    return _content_index_version, snapshot
+
+
+def _save_content_index(version: int, snapshot: dict[str, dict[str, list]]) -> None:
+    """Write a snapshot to disk outside the index lock, unless a newer one was."""
+    global _content_index_saved_version
+    if not CONTENT_INDEX_PATH:
+        return
+    with _CONTENT_INDEX_WRITE_LOCK:
+        if version <= _content_index_saved_version:
+            return
+        _write_json_atomic(CONTENT_INDEX_PATH, snapshot)
+        _content_index_saved_version = version
+
+
+def _hash_upload_source(source: Any) -> Optional[str]:
+    """Return the hex SHA-256 of an upload source, or None if it can't be read.
+
+    Streams are hashed in place (without copying an in-memory buffer) and
+    rewound afterwards; paths are opened and hashed in chunks.
+    """
+    try:
+        if isinstance(source, str):
+            with open(source, "rb") as fh:
+                return hashlib.file_digest(fh, "sha256").hexdigest()
+        _rewind(source)
+        digest = hashlib.file_digest(source, "sha256").hexdigest()
+        _rewind(source)
+        return digest
+    except (OSError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def _lookup_content(store_name: str, content_hash: Optional[str]) -> Optional[str]:
+    """Return the document name previously uploaded with content_hash, if any."""
+    if not content_hash:
+        return None
+    with _CONTENT_HASH_INDEX_LOCK:
+        entry = _CONTENT_HASH_INDEX.get(store_name, {}).get(content_hash)
+    if entry is None or time.time() - entry[1] >= CONTENT_INDEX_TTL_SECONDS:
+        return None
+    return entry[0]
+
+
+def _remember_content(store_name: str, content_hash: str, document_name: str) -> None:
+    """Record that content_hash was uploaded to store_name as document_name."""
+    now = time.time()
+    with _CONTENT_HASH_INDEX_LOCK:
+        _CONTENT_HASH_INDEX.setdefault(store_name, {})[content_hash] = (
+            document_name,
+            now,
+        )
+        _prune_content_index(_CONTENT_HASH_INDEX, now)
+        version, snapshot = _snapshot_content_index()
+    _save_content_index(version, snapshot)
+
+
+def _forget_content(store_name: str, document_name: Optional[str] = None) -> None:
+    """Drop content hashes pointing at document_name, or the whole store's."""
+    with _CONTENT_HASH_INDEX_LOCK:
+        hashes = _CONTENT_HASH_INDEX.get(store_name)
+        if not hashes:
+            return
+        if document_name is None:
+            del _CONTENT_HASH_INDEX[store_name]
+        else:
+            for content_hash, (name, _) in list(hashes.items()):
+                if name == document_name:
+                    del hashes[content_hash]
+        version, snapshot = _snapshot_content_index()
+    _save_content_index(version, snapshot)
+
+
+def _is_live_document(document: Any) -> bool:
+    """Return True if a fetched document can stand in for a fresh upload."""
+    return getattr(document, "state", None) is not types.DocumentState.STATE_FAILED
+
+
+def _deduped_result(file_name: str) -> UploadResult:
+    """Build the result for an upload skipped because its content is indexed."""
+    return UploadResult(file_name=file_name, success=True, deduped=True)
+
+
+# MIME types for the supported upload extensions
+_MIME_TYPES = {
+    ".pdf": "application/pdf",
+    ".txt": "text/plain",
+    ".text": "text/plain",
+}
+
+
+def _mime_type_for_ext(ext: str, provided_type: Optional[str] = None) -> str:
+    """Return provided_type, or the MIME type for a lowercase extension like ".pdf"."""
+    if provided_type:
+        return provided_type
+    return _MIME_TYPES.get(ext, "application/octet-stream")
 
 
 def _detect_mime_type(file_name: str, provided_type: Optional[str] = None) -> str:
@@ -114,18 +530,259 @@ def _detect_mime_type(file_name: str, provided_type: Optional[str] = None) -> st
     Returns:
         MIME type string (application/pdf, text/plain, etc.).
     """
-    if provided_type:
-        return provided_type
+    return _mime_type_for_ext(os.path.splitext(file_name)[1].lower(), provided_type)
 
-    # Detect MIME type from file extension
-    file_ext = os.path.splitext(file_name)[1].lower()
-    mime_types = {
-        ".pdf": "application/pdf",
-        ".txt": "text/plain",
-        ".text": "text/plain",
-    }
 
-    return mime_types.get(file_ext, "application/octet-stream")
+def _rewind(source: Any) -> None:
+    """Seek a stream upload source back to its start; paths are left alone."""
+    if isinstance(source, io.IOBase):
+        source.seek(0)
+
+
+# Maximum time to wait for a document to finish indexing
+OPERATION_TIMEOUT_SECONDS = 15 * 60  # 15 minutes
+
+
+def _progress_percent(operation: Any) -> Optional[float]:
+    """Return the completion percentage an operation reports, if any.
+
+    Operation metadata is a plain dict on this SDK, so both the snake_case
+    and the wire camelCase spellings are accepted.
+    """
+    metadata = getattr(operation, "metadata", None)
+    if not isinstance(metadata, dict):
+        return None
+    percent = metadata.get("progress_percent", metadata.get("progressPercent"))
+    try:
+        percent = float(percent)
+    except (TypeError, ValueError):
+        return None
+    return percent if 0 <= percent < 100 else None
+
+
+class _PollSchedule:
+    """Backoff and status-callback timing shared by the sync and async poll loops.
+
+    The SDK has no blocking wait for operations. When the operation reports
+    its progress, the next poll is scheduled about halfway to the predicted
+    completion time; otherwise polls are spaced with a long exponential
+    backoff. Sleeps are split into status_interval slices so the status
+    callback keeps its cadence however long the next poll is away.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float,
+        status_callback: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        self.status_callback = status_callback
+        self.status_interval = 10.0  # Update every 10 seconds
+        # Monotonic clock, so wall-clock adjustments can't stretch or cut the wait
+        self.start = time.monotonic()
+        self.deadline = self.start + timeout_seconds
+        self.next_status_at = self.start + self.status_interval
+        self.wait_time = 5  # Initial wait time in seconds
+        self.max_wait_time = 60  # Maximum wait time in seconds
+        self.min_hinted_wait = 1.0  # Floor for progress-based waits
+        self.max_jitter = 0.5  # Random spread so concurrent polls don't align
+
+    def next_delay(self, operation: Any = None) -> Optional[float]:
+        """Return the seconds to wait before the next poll, or None once timed out."""
+        now = time.monotonic()
+
+        # Check timeout
+        if now > self.deadline:
+            return None
+
+        elapsed = now - self.start
+        percent = _progress_percent(operation)
+        if percent is not None and elapsed > 0:
+            # Extrapolate the observed rate and poll halfway to the estimate
+            remaining = elapsed * (100 - percent) / max(percent, 1)
+            delay = max(min(remaining * 0.5, self.max_wait_time), self.min_hinted_wait)
+            return delay + random.uniform(0, self.max_jitter)
+
+        delay = self.wait_time
+        # Exponentially increase wait time for the next poll, up to a maximum.
+        # This avoids spamming the API with requests during long-running operations.
+        self.wait_time = min(self.wait_time * 2, self.max_wait_time)
+        return delay
+
+    def _report_status(self) -> None:
+        """Call the status callback if status_interval has elapsed since it last ran."""
+        if self.status_callback is None:
+            return
+        now = time.monotonic()
+        if now >= self.next_status_at:
+            self.status_callback(now - self.start)
+            self.next_status_at = now + self.status_interval
+
+    def _slices(self, delay: float) -> Iterator[float]:
+        """Split delay into sleeps of at most status_interval, reporting between."""
+        remaining = delay
+        while remaining > 0:
+            self._report_status()
+            step = min(remaining, self.status_interval)
+            yield step
+            remaining -= step
+
+    def wait(self, operation: Any = None) -> bool:
+        """Sleep until the next poll is due; return False once timed out."""
+        delay = self.next_delay(operation)
+        if delay is None:
+            return False
+        for step in self._slices(delay):
+            time.sleep(step)
+        return True
+
+    async def wait_async(self, operation: Any = None) -> bool:
+        """Async counterpart of wait() that awaits asyncio.sleep."""
+        delay = self.next_delay(operation)
+        if delay is None:
+            return False
+        for step in self._slices(delay):
+            await asyncio.sleep(step)
+        return True
+
+
+def _prepare_upload_source(
+    uploaded_file: Any, ext: str
+) -> tuple[Any, Optional[str]]:
+    """Return what to hand the SDK for uploaded_file, plus any temp file created.
+
+    ext is the file's lowercase extension, already split off by the caller.
+    """
+    if isinstance(uploaded_file, io.IOBase):
+        # Streamlit's UploadedFile is a seekable binary stream; hand it to
+        # the SDK as-is instead of copying its contents to disk first.
+        return uploaded_file, None
+
+    if isinstance(uploaded_file, pathlib.PurePath):
+        # Already on disk; upload it from where it is.
+        return os.fspath(uploaded_file), None
+
+    if hasattr(uploaded_file, "getvalue"):
+        # Contents are already in memory; wrap them (BytesIO shares the bytes
+        # object) rather than writing them to disk and reading them back.
+        return io.BytesIO(uploaded_file.getvalue()), None
+
+    # Only a read() interface: stream to a temporary file in 1 MiB chunks so
+    # peak memory stays at one chunk
+    with tempfile.NamedTemporaryFile(delete=False, suffix=ext or ".tmp") as tmp:
+        if hasattr(uploaded_file, "seek"):
+            uploaded_file.seek(0)
+        shutil.copyfileobj(uploaded_file, tmp, length=1 << 20)
+    return tmp.name, tmp.name
+
+
+def _remove_temp_file(tmp_path: Optional[str]) -> None:
+    """Delete a temporary upload file, ignoring errors."""
+    if tmp_path and os.path.exists(tmp_path):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _timeout_result(file_name: str) -> UploadResult:
+    """Result for an upload whose indexing did not finish in time."""
+    return UploadResult(
+        file_name=file_name,
+        success=False,
+        error_message=f"Indexing timed out after {OPERATION_TIMEOUT_SECONDS} seconds.",
+    )
+
+
+def _operation_result(
+    store_name: str,
+    file_name: str,
+    operation: Any,
+    content_hash: Optional[str] = None,
+) -> UploadResult:
+    """Turn a finished upload/import operation into an UploadResult.
+
+    On success, content_hash (if given) is recorded against the new document
+    so later uploads of the same bytes can be skipped.
+    """
+    # Check if operation succeeded
+    error = getattr(operation, "error", None)
+    if error:
+        # The SDK exposes the operation error as a plain dict
+        if isinstance(error, dict):
+            code, message = error.get("code", "UNKNOWN"), error.get("message", "")
+        else:
+            code = getattr(error, "code", "UNKNOWN")
+            message = getattr(error, "message", "")
+        return UploadResult(
+            file_name=file_name,
+            success=False,
+            error_message=f"{code} | {message}",
+        )
+
+    # A finished operation without an error means the document is indexed,
+    # so record it without a separate documents.get round trip
+    response = getattr(operation, "response", None)
+    document_name = getattr(response, "document_name", None) if response else None
+    if document_name:
+        _index_document(
+            store_name,
+            DocumentInfo(
+                name=document_name,
+                display_name=file_name,
+                state=types.DocumentState.STATE_ACTIVE,
+            ),
+        )
+        if content_hash:
+            _remember_content(store_name, content_hash, document_name)
+    else:
+        # The document's details are unknown; re-list on the next lookup
+        refresh_doc_index(store_name)
+    return UploadResult(file_name=file_name, success=True)
+
+
+@dataclass(slots=True)
+class _PreparedUpload:
+    """Everything computed locally before a file is sent to the API."""
+
+    source: Any
+    tmp_path: Optional[str]
+    mime_type: str
+    content_hash: Optional[str]
+    # Document previously uploaded with the same content, still to be confirmed
+    known_document: Optional[str]
+
+
+def _prepare_upload(store_name: str, uploaded_file: Any) -> _PreparedUpload:
+    """Stage uploaded_file, hash it and look up an earlier upload of its content.
+
+    This is the blocking part shared by the sync and async uploads (it may copy
+    to a temp file and reads the whole file to hash it), so the async path runs
+    it in a worker thread.
+    """
+    # Split the extension once for both the temp suffix and MIME lookup
+    ext = os.path.splitext(uploaded_file.name)[1].lower()
+    source, tmp_path = _prepare_upload_source(uploaded_file, ext)
+    content_hash = _hash_upload_source(source)
+    return _PreparedUpload(
+        source=source,
+        tmp_path=tmp_path,
+        mime_type=_mime_type_for_ext(ext, getattr(uploaded_file, "type", None)),
+        content_hash=content_hash,
+        known_document=_lookup_content(store_name, content_hash),
+    )
+
+
+def _reuse_known_document(
+    store_name: str, prepared: _PreparedUpload, document: Any
+) -> bool:
+    """Return True if the fetched known document makes the upload unnecessary.
+
+    A missing or failed document is dropped from the content index instead.
+    """
+    if document is not None and _is_live_document(document):
+        return True
+    _forget_content(store_name, prepared.known_document)
+    return False
 
 
 def upload_single_file(
@@ -139,7 +796,9 @@ def upload_single_file(
     Args:
         client: google-genai client instance.
         store_name: Fully qualified File Search store name.
-        uploaded_file: Streamlit uploaded file object (PDF or TXT).
+        uploaded_file: Streamlit uploaded file object (PDF or TXT). Streams and
+                       in-memory contents are uploaded directly; objects that
+                       only offer read() are staged through a temporary file.
         status_callback: Optional callback function that receives elapsed seconds.
                         Called every 10 seconds during indexing to provide status updates.
 
@@ -150,19 +809,27 @@ def upload_single_file(
     staged_file_name: Optional[str] = None
 
     try:
-        # Save uploaded file to temporary location
-        suffix = os.path.splitext(uploaded_file.name)[1] or ".tmp"
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            tmp.write(uploaded_file.getvalue())
-            tmp_path = tmp.name
+        prepared = _prepare_upload(store_name, uploaded_file)
+        tmp_path = prepared.tmp_path
+        upload_source, mime_type = prepared.source, prepared.mime_type
+        content_hash = prepared.content_hash
 
-        # Detect MIME type
-        mime_type = _detect_mime_type(uploaded_file.name, uploaded_file.type)
+        # Skip the upload and indexing wait if these bytes are already indexed
+        if prepared.known_document:
+            try:
+                document = client.file_search_stores.documents.get(
+                    name=prepared.known_document
+                )
+            except Exception:
+                document = None
+            if _reuse_known_document(store_name, prepared, document):
+                return _deduped_result(uploaded_file.name)
 
         # Try direct upload first
         try:
+            _rewind(upload_source)
             operation = client.file_search_stores.upload_to_file_search_store(
-                file=tmp_path,
+                file=upload_source,
                 file_search_store_name=store_name,
                 config={
                     "display_name": uploaded_file.name,
@@ -171,8 +838,9 @@ def upload_single_file(
             )
         except genai_errors.APIError:
             # Fallback to Files API import
+            _rewind(upload_source)
             file_resource = client.files.upload(
-                file=tmp_path,
+                file=upload_source,
                 config=types.UploadFileConfig(
                     display_name=uploaded_file.name,
                     mime_type=mime_type,
@@ -191,7 +859,13 @@ def upload_single_file(
                 file_name=staged_file_name,
             )
 
-        # Poll until operation completes with exponential backoff.
+        # Small files can finish indexing synchronously; skip polling entirely
+        if getattr(operation, "done", False):
+            return _operation_result(
+                store_name, uploaded_file.name, operation, content_hash
+            )
+
+        # Poll until the operation completes.
         op_name = getattr(operation, "name", None)
         if not op_name:
             return UploadResult(
@@ -201,68 +875,149 @@ def upload_single_file(
             )
 
         current = operation
-        timeout_seconds = 15 * 60  # 15 minutes
-        start_time = time.time()
-        last_status_update = 0.0
-        status_interval = 10.0  # Update every 10 seconds
-        wait_time = 2  # Initial wait time in seconds
-        max_wait_time = 32  # Maximum wait time in seconds
-
+        schedule = _PollSchedule(OPERATION_TIMEOUT_SECONDS, status_callback)
         while not getattr(current, "done", False):
-            elapsed = time.time() - start_time
+            # Wait before polling again
+            if not schedule.wait(current):
+                return _timeout_result(uploaded_file.name)
+            current = client.operations.get(current)
+
+        return _operation_result(store_name, uploaded_file.name, current, content_hash)
+
+    except Exception as exc:
+        return UploadResult(
+            file_name=uploaded_file.name,
+            success=False,
+            error_message=str(exc),
+        )
+
+    finally:
+        # Clean up temporary file
+        _remove_temp_file(tmp_path)
+
+        # Clean up staged file if used
+        if staged_file_name:
+            try:
+                client.files.delete(name=staged_file_name)
+            except Exception:
+                logger.debug(
+                    "Deleting staged file %s failed", staged_file_name, exc_info=True
+                )
+
+
+async def _await_operation(
+    client: genai.Client,
+    operation: Any,
+    timeout_seconds: float = OPERATION_TIMEOUT_SECONDS,
+    status_callback: Optional[Callable[[float], None]] = None,
+) -> Optional[Any]:
+    """Poll a long-running operation without blocking the event loop.
+
+    Returns:
+        The finished operation, or None if it did not finish within timeout_seconds.
+    """
+    current = operation
+    schedule = _PollSchedule(timeout_seconds, status_callback)
+    while not getattr(current, "done", False):
+        if not await schedule.wait_async(current):
+            return None
+        current = await client.aio.operations.get(current)
+
+    return current
+
+
+async def upload_single_file_async(
+    client: genai.Client,
+    store_name: str,
+    uploaded_file: Any,
+    status_callback: Optional[Callable[[float], None]] = None,
+) -> UploadResult:
+    """Async counterpart of upload_single_file using the client's aio interface.
+
+    Many uploads can be driven from one event loop this way, since polling
+    awaits asyncio.sleep instead of holding a thread in time.sleep.
+
+    Args:
+        client: google-genai client instance.
+        store_name: Fully qualified File Search store name.
+        uploaded_file: Streamlit uploaded file object (PDF or TXT).
+        status_callback: Optional callback function that receives elapsed seconds.
+
+    Returns:
+        UploadResult with success status.
+    """
+    tmp_path: Optional[str] = None
+    staged_file_name: Optional[str] = None
 
-            # Check timeout
-            if elapsed > timeout_seconds:
+    try:
+        # Staging and hashing block, so keep them off the event loop
+        prepared = await asyncio.to_thread(_prepare_upload, store_name, uploaded_file)
+        tmp_path = prepared.tmp_path
+        upload_source, mime_type = prepared.source, prepared.mime_type
+        content_hash = prepared.content_hash
+
+        if prepared.known_document:
+            try:
+                document = await client.aio.file_search_stores.documents.get(
+                    name=prepared.known_document
+                )
+            except Exception:
+                document = None
+            if _reuse_known_document(store_name, prepared, document):
+                return _deduped_result(uploaded_file.name)
+
+        try:
+            _rewind(upload_source)
+            operation = await client.aio.file_search_stores.upload_to_file_search_store(
+                file=upload_source,
+                file_search_store_name=store_name,
+                config={
+                    "display_name": uploaded_file.name,
+                    "mime_type": mime_type,
+                },
+            )
+        except genai_errors.APIError:
+            # Fallback to Files API import
+            _rewind(upload_source)
+            file_resource = await client.aio.files.upload(
+                file=upload_source,
+                config=types.UploadFileConfig(
+                    display_name=uploaded_file.name,
+                    mime_type=mime_type,
+                ),
+            )
+            staged_file_name = getattr(file_resource, "name", None)
+            if not staged_file_name:
                 return UploadResult(
                     file_name=uploaded_file.name,
                     success=False,
-                    error_message=f"Indexing timed out after {timeout_seconds} seconds.",
+                    error_message="Files API did not return a resource name.",
                 )
 
-            # Call status callback every 10 seconds
-            if status_callback and (elapsed - last_status_update >= status_interval):
-                status_callback(elapsed)
-                last_status_update = elapsed
-
-            # Wait before polling again
-            time.sleep(wait_time)
-
-            # Exponentially increase wait time for the next poll, up to a maximum.
-            # This avoids spamming the API with requests during long-running operations.
-            wait_time = min(wait_time * 2, max_wait_time)
+            operation = await client.aio.file_search_stores.import_file(
+                file_search_store_name=store_name,
+                file_name=staged_file_name,
+            )
 
-            current = client.operations.get(current)
+        if getattr(operation, "done", False):
+            return _operation_result(
+                store_name, uploaded_file.name, operation, content_hash
+            )
 
-        # Check if operation succeeded
-        error = getattr(current, "error", None)
-        if error:
+        if not getattr(operation, "name", None):
             return UploadResult(
                 file_name=uploaded_file.name,
                 success=False,
-                error_message=f"{getattr(error, 'code', 'UNKNOWN')} | {getattr(error, 'message', '')}",
+                error_message="Operation has no name attribute.",
             )
 
-        # Verify document state if available
-        response = getattr(current, "response", None)
-        document_name = getattr(response, "document_name", None) if response else None
-        if document_name:
-            try:
-                document = client.file_search_stores.documents.get(name=document_name)
-                document_state = document.state
-                if document_state == types.DocumentState.ACTIVE:
-                    return UploadResult(file_name=uploaded_file.name, success=True)
-                else:
-                    return UploadResult(
-                        file_name=uploaded_file.name,
-                        success=False,
-                        error_message=f"Document state: {document_state}",
-                    )
-            except Exception:
-                # If we can't verify, assume success if no error
-                pass
+        current = await _await_operation(
+            client, operation, status_callback=status_callback
+        )
+        if current is None:
+            return _timeout_result(uploaded_file.name)
 
-        # If we got here with no error, assume success
-        return UploadResult(file_name=uploaded_file.name, success=True)
+        return _operation_result(store_name, uploaded_file.name, current, content_hash)
 
     except Exception as exc:
         return UploadResult(
@@ -272,19 +1027,219 @@ def upload_single_file(
         )
 
     finally:
-        # Clean up temporary file
-        if tmp_path and os.path.exists(tmp_path):
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
+        _remove_temp_file(tmp_path)
 
-        # Clean up staged file if used
         if staged_file_name:
             try:
-                client.files.delete(name=staged_file_name)
+                await client.aio.files.delete(name=staged_file_name)
             except Exception:
-                pass
+                logger.debug(
+                    "Deleting staged file %s failed", staged_file_name, exc_info=True
+                )
+
+
+async def upload_many_async(
+    client: genai.Client,
+    store_name: str,
+    uploaded_files: list[Any],
+    max_concurrency: int = 5,
+) -> list[UploadResult]:
+    """Upload several files from one event loop, at most max_concurrency at a time.
+
+    Args:
+        client: google-genai client instance.
+        store_name: Fully qualified File Search store name.
+        uploaded_files: Streamlit uploaded file objects (PDF or TXT).
+        max_concurrency: Maximum number of uploads in flight at once.
+
+    Returns:
+        List of UploadResult objects, in the same order as uploaded_files.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def upload(uploaded_file: Any) -> UploadResult:
+        async with semaphore:
+            return await upload_single_file_async(client, store_name, uploaded_file)
+
+    return list(await asyncio.gather(*(upload(f) for f in uploaded_files)))
+
+
+def upload_if_absent(
+    client: genai.Client,
+    store_name: str,
+    uploaded_file: Any,
+    status_callback: Optional[Callable[[float], None]] = None,
+) -> UploadResult:
+    """Upload a file unless an active document with the same name is in the store.
+
+    The duplicate check and the post-upload bookkeeping share the store's
+    cached document index, so the store is listed at most once.
+
+    Args:
+        client: google-genai client instance.
+        store_name: Fully qualified File Search store name.
+        uploaded_file: Streamlit uploaded file object (PDF or TXT).
+        status_callback: Passed through to upload_single_file.
+
+    Returns:
+        UploadResult with skipped=True if the document already exists.
+    """
+    existing = document_exists(client, store_name, uploaded_file.name)
+    if existing is not None and existing.state is types.DocumentState.STATE_ACTIVE:
+        return UploadResult(file_name=uploaded_file.name, success=True, skipped=True)
+
+    return upload_single_file(client, store_name, uploaded_file, status_callback)
+
+
+def _upload_as_completed(
+    executor: concurrent.futures.Executor,
+    client: genai.Client,
+    store_name: str,
+    uploaded_files: list[Any],
+    status_callback: Optional[Callable[[float], None]],
+    status_interval: float,
+) -> Iterator[tuple[int, UploadResult]]:
+    """Submit uploads to executor and yield (input index, result) as each finishes.
+
+    While uploads are pending, status_callback receives the elapsed seconds at
+    least every status_interval seconds.
+    """
+    futures = {
+        executor.submit(upload_single_file, client, store_name, uploaded_file): index
+        for index, uploaded_file in enumerate(uploaded_files)
+    }
+    pending = set(futures)
+    start = time.monotonic()
+    while pending:
+        done, pending = concurrent.futures.wait(
+            pending,
+            timeout=status_interval,
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        for future in done:
+            index = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:
+                result = UploadResult(
+                    file_name=uploaded_files[index].name,
+                    success=False,
+                    error_message=f"Generated an exception: {exc}",
+                )
+            yield index, result
+        # After the finished results, so the callback sees them counted
+        if status_callback:
+            status_callback(time.monotonic() - start)
+
+
+def _indexed_uploads(
+    client: genai.Client,
+    store_name: str,
+    uploaded_files: list[Any],
+    max_workers: int,
+    executor: Optional[concurrent.futures.Executor],
+    status_callback: Optional[Callable[[float], None]],
+    status_interval: float,
+) -> Iterator[tuple[int, UploadResult]]:
+    """Run _upload_as_completed on executor, or on a pool owned by this call."""
+    if not uploaded_files:
+        return
+    if executor is not None:
+        yield from _upload_as_completed(
+            executor,
+            client,
+            store_name,
+            uploaded_files,
+            status_callback,
+            status_interval,
+        )
+        return
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(uploaded_files))
+    ) as owned_executor:
+        yield from _upload_as_completed(
+            owned_executor,
+            client,
+            store_name,
+            uploaded_files,
+            status_callback,
+            status_interval,
+        )
+
+
+def upload_files_parallel(
+    client: genai.Client,
+    store_name: str,
+    uploaded_files: list[Any],
+    max_workers: int = 6,
+    executor: Optional[concurrent.futures.Executor] = None,
+    status_callback: Optional[Callable[[float], None]] = None,
+    status_interval: float = 10.0,
+) -> Iterator[UploadResult]:
+    """Upload files concurrently, yielding each result as soon as it finishes.
+
+    Uploads spend most of their time waiting on the network or sleeping between
+    operation polls, both of which release the GIL, so threads overlap well.
+    A single genai.Client is safe to share across the worker threads.
+
+    Args:
+        client: google-genai client instance.
+        store_name: Fully qualified File Search store name.
+        uploaded_files: Streamlit uploaded file objects (PDF or TXT).
+        max_workers: Maximum number of concurrent uploads; kept small to stay
+                     under the API's per-client concurrency limits. Ignored
+                     when executor is given.
+        executor: Optional long-lived pool to run the uploads on; by default a
+                  pool is created for this call and shut down afterwards.
+        status_callback: Optional callback that receives elapsed seconds,
+                         called on the consuming thread every status_interval
+                         seconds and after each batch of finished results.
+        status_interval: Seconds between status callbacks while uploads are
+                         pending.
+
+    Yields:
+        UploadResult objects in completion order.
+    """
+    for _, result in _indexed_uploads(
+        client,
+        store_name,
+        uploaded_files,
+        max_workers,
+        executor,
+        status_callback,
+        status_interval,
+    ):
+        yield result
+
+
+def upload_files_batch(
+    client: genai.Client,
+    store_name: str,
+    uploaded_files: list[Any],
+    max_workers: int = 8,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> list[UploadResult]:
+    """Upload several files concurrently and wait for all of them to be indexed.
+
+    This is upload_files_parallel with the results put back in input order;
+    the batch takes roughly as long as its slowest file instead of the sum.
+
+    Args:
+        client: google-genai client instance.
+        store_name: Fully qualified File Search store name.
+        uploaded_files: Streamlit uploaded file objects (PDF or TXT).
+        max_workers: Maximum number of files uploaded at the same time.
+        executor: Optional long-lived pool to run the uploads on.
+
+    Returns:
+        List of UploadResult objects, in the same order as uploaded_files.
+    """
+    results: list[Optional[UploadResult]] = [None] * len(uploaded_files)
+    for index, result in _indexed_uploads(
+        client, store_name, uploaded_files, max_workers, executor, None, 10.0
+    ):
+        results[index] = result
+    return results
 
 
 def delete_document(client: genai.Client, store_name: str, display_name: str) -> bool:
@@ -298,20 +1253,24 @@ def delete_document(client: genai.Client, store_name: str, display_name: str) ->
     Returns:
         True if the document was deleted, False otherwise.
     """
+    doc = _load_doc_index(client, store_name).get(display_name)
+    if doc is None:
+        return False
+
     try:
-        for doc in client.file_search_stores.documents.list(parent=store_name):
-            if getattr(doc, "display_name", "") == display_name:
-                try:
-                    client.file_search_stores.documents.delete(
-                        name=doc.name, config={"force": True}
-                    )
-                    return True
-                except Exception:
-                    return False
+        client.file_search_stores.documents.delete(
+            name=doc.name, config={"force": True}
+        )
     except Exception:
-        pass
+        # The index may be stale; re-list on the next lookup
+        logger.debug("Deleting %s failed", doc.name, exc_info=True)
+        refresh_doc_index(store_name)
+        return False
 
-    return False
+    with _DOC_INDEX_LOCK:
+        _DOC_INDEX.get(store_name, {}).pop(display_name, None)
+    _forget_content(store_name, doc.name)
+    return True
 
 
 def clear_store(client: genai.Client, store_name: str) -> ClearStoreResult:
@@ -326,6 +1285,9 @@ def clear_store(client: genai.Client, store_name: str) -> ClearStoreResult:
     """
     try:
         client.file_search_stores.delete(name=store_name)
+        _forget_store_name(store_name)
+        refresh_doc_index(store_name)
+        _forget_content(store_name)
         return ClearStoreResult(deleted=True)
     except Exception as exc:
         return ClearStoreResult(deleted=False, errors=[str(exc)])
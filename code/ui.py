@@ -0,0 +1,174 @@
+"""Streamlit UI helpers shared by the Gemini File Search app.
+
+Keeping these in an imported module means they are compiled once per process,
+while ``app.py`` (re-executed on every rerun) only holds the page script.
+"""
+
+import os
+import traceback
+from types import SimpleNamespace
+from typing import Optional
+
+import streamlit as st
+from dotenv import load_dotenv
+from file_search_service import get_client
+from google import genai
+from google.genai import types
+from streamlit.delta_generator import DeltaGenerator
+
+
+@st.cache_resource(show_spinner=False)
+def bootstrap() -> SimpleNamespace:
+    """Load configuration and create the client once per process, not per rerun."""
+    load_dotenv()
+    api_key = os.getenv("GEMINI_API_KEY")
+    return SimpleNamespace(
+        api_key=api_key,
+        model=os.getenv("USE_MODEL", "gemini-2.5-flash"),
+        store=os.getenv("FILE_SEARCH_STORE", "demo_filesearch_store"),
+        client=get_client(api_key) if api_key else None,
+    )
+
+
+_SAFETY_MESSAGE = "Error: The response was blocked for safety reasons."
+_OTHER_MESSAGE = "Error: The response was blocked for other reasons."
+
+# Finish reasons that mean the model withheld its answer
+_FINISH_REASON_ERRORS = {
+    types.FinishReason.SAFETY: _SAFETY_MESSAGE,
+    types.FinishReason.IMAGE_SAFETY: _SAFETY_MESSAGE,
+    types.FinishReason.BLOCKLIST: _SAFETY_MESSAGE,
+    types.FinishReason.PROHIBITED_CONTENT: _SAFETY_MESSAGE,
+    types.FinishReason.SPII: _SAFETY_MESSAGE,
+    types.FinishReason.OTHER: _OTHER_MESSAGE,
+    types.FinishReason.IMAGE_OTHER: _OTHER_MESSAGE,
+}
+
+
+def _extract_error(response: types.GenerateContentResponse) -> str:
+    """Describe why a model response carries no usable text."""
+    candidates = getattr(response, "candidates", None)
+    if not candidates:
+        return "Error: No candidates in the response."
+
+    finish_reason = getattr(candidates[0], "finish_reason", None)
+    return _FINISH_REASON_ERRORS.get(
+        finish_reason, "Error: Response does not contain text content."
+    )
+
+
+# Most recent messages (user and model turns) resent as context; even, so the
+# trimmed history still opens with a user turn
+CHAT_HISTORY_LIMIT = 20
+
+
+def handle_chat_prompt(
+    prompt: str,
+    client: genai.Client,
+    model_name: str,
+    config: types.GenerateContentConfig,
+    container: Optional[DeltaGenerator] = None,
+):
+    """Handles the user's chat prompt, generates a response, and updates the chat history.
+
+    The new turns are written into container (default: the main area), so a
+    caller can place them above an inline chat input.
+
+    The last CHAT_HISTORY_LIMIT messages of ``chat_history`` are sent as
+    ``contents`` so follow-up questions keep their grounding, and the unchanged
+    prefix is eligible for Gemini's implicit caching. Only real model replies
+    enter that history; errors are shown and kept in the display-only
+    ``chat_log``, and the unanswered question is dropped from the history.
+    """
+    history: list[types.Content] = st.session_state.chat_history
+    user_turn = types.Content(role="user", parts=[types.Part(text=prompt)])
+    history.append(user_turn)
+    target = st if container is None else container
+    with target.chat_message("user"):
+        st.markdown(prompt)
+
+    with target.chat_message("assistant"):
+        answer = None
+        model_text = None
+        citations = []
+        response = None
+        streamed_text = None
+        chunks = []
+
+        def stream_text(stream):
+            """Yield the text of each streamed chunk, keeping the chunks for parsing.
+
+            Citation metadata arrives with the chunks carrying the cited text,
+            not with the final chunk, so it is collected from every chunk.
+            """
+            for chunk in stream:
+                chunks.append(chunk)
+                for candidate in getattr(chunk, "candidates", None) or []:
+                    metadata = getattr(candidate, "citation_metadata", None)
+                    citations.extend(getattr(metadata, "citations", None) or [])
+                text = getattr(chunk, "text", None)
+                if text:
+                    yield text
+
+        try:
+            stream = client.models.generate_content_stream(
+                model=model_name,
+                contents=history,
+                config=config,
+            )
+            # Tokens are rendered as they arrive instead of after full generation
+            streamed = st.write_stream(stream_text(stream))
+            if isinstance(streamed, str) and streamed:
+                streamed_text = answer = model_text = streamed
+            # The last chunk with candidates carries finish_reason
+            response = next(
+                (c for c in reversed(chunks) if getattr(c, "candidates", None)),
+                None,
+            )
+        except Exception as e:
+            error_msg = f"Error generating response: {str(e)}"
+            answer = error_msg
+            st.error(error_msg)
+
+        # Fast path: the streamed text (or the SDK's text helper); otherwise
+        # explain why the response has no usable text
+        if response is not None:
+            try:
+                model_text = streamed_text or response.text
+                answer = model_text or _extract_error(response)
+            except Exception as e:
+                model_text = None
+                answer = f"Error parsing response: {str(e)}"
+                st.error(f"Details: {traceback.format_exc()}")
+        elif answer is None:
+            answer = "Error: No response received from the model."
+
+        # Display the answer or error (streamed text is already on screen)
+        if answer:
+            if answer != streamed_text:
+                st.markdown(answer)
+
+            # Display citations if available
+            if citations:
+                lines = []
+                for citation in citations:
+                    uri = getattr(citation, "uri", None)
+                    label = getattr(citation, "title", None) or uri or "Source"
+                    line = f"- [{label}]({uri})" if uri else f"- {label}"
+                    # A source cited by several chunks is listed once
+                    if line not in lines:
+                        lines.append(line)
+                # One markdown element for the whole list instead of one per citation
+                st.markdown("**Citations**\n\n" + "\n".join(lines))
+        else:
+            st.error("Error: Unable to extract answer from the response.")
+            answer = "Error: Unable to extract answer from the response."
+
+    st.session_state.chat_log.extend(
+        [user_turn, types.Content(role="model", parts=[types.Part(text=answer)])]
+    )
+    if model_text:
+        history.append(types.Content(role="model", parts=[types.Part(text=model_text)]))
+        del history[:-CHAT_HISTORY_LIMIT]
+    else:
+        history.pop()
@@ -1,15 +1,48 @@
+import asyncio
+import concurrent.futures
+import io
+import json
+import os
+import tempfile
+import time
 import unittest
+from code import file_search_service
 from code.file_search_service import (
     UploadResult,
+    clear_store,
+    delete_document,
     document_exists,
     get_or_create_store,
+    list_store_documents,
+    upload_files_batch,
+    upload_files_parallel,
+    upload_if_absent,
+    upload_many_async,
     upload_single_file,
 )
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, mock_open, patch
+
+from google.genai import errors as genai_errors
+from google.genai import types
 
 
 class TestFileSearchService(unittest.TestCase):
 
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        cache_paths = patch.multiple(
+            file_search_service,
+            STORE_CACHE_PATH=os.path.join(cache_dir.name, "stores.json"),
+            CONTENT_INDEX_PATH=os.path.join(cache_dir.name, "content.json"),
+        )
+        cache_paths.start()
+        self.addCleanup(cache_paths.stop)
+        file_search_service._STORE_NAME_CACHE.clear()
+        file_search_service._VERIFIED_STORE_NAMES.clear()
+        file_search_service._CONTENT_HASH_INDEX.clear()
+        file_search_service._DOC_INDEX.clear()
+
     @patch("google.genai.Client")
     def test_get_or_create_store_exists(self, MockClient):
         # Arrange
@@ -44,6 +77,142 @@ class TestFileSearchService(unittest.TestCase):
             config={"display_name": "new_store"}
         )
 
+    @patch("google.genai.Client")
+    def test_get_or_create_store_uses_cache(self, MockClient):
+        # Arrange
+        mock_client_instance = MockClient()
+        mock_store = MagicMock()
+        mock_store.display_name = "cached_store"
+        mock_store.name = "fileSearchStores/cached_store_789"
+        mock_client_instance.file_search_stores.list.return_value = [mock_store]
+
+        # Act
+        first = get_or_create_store(mock_client_instance, "cached_store")
+        second = get_or_create_store(mock_client_instance, "cached_store")
+
+        # Assert
+        self.assertEqual(first, second)
+        mock_client_instance.file_search_stores.list.assert_called_once()
+
+    @patch("google.genai.Client")
+    def test_get_or_create_store_persists_cache(self, MockClient):
+        # Arrange
+        mock_client_instance = MockClient()
+        mock_store = MagicMock()
+        mock_store.display_name = "cached_store"
+        mock_store.name = "fileSearchStores/cached_store_789"
+        mock_client_instance.file_search_stores.list.return_value = [mock_store]
+        get_or_create_store(mock_client_instance, "cached_store")
+
+        # Act: simulate a restart by reloading the cache from disk
+        self._restart_store_cache()
+        result = get_or_create_store(mock_client_instance, "cached_store")
+
+        # Assert: the persisted name is confirmed with a get, not a list
+        self.assertEqual(result, "fileSearchStores/cached_store_789")
+        mock_client_instance.file_search_stores.list.assert_called_once()
+        mock_client_instance.file_search_stores.get.assert_called_once_with(
+            name="fileSearchStores/cached_store_789"
+        )
+
+    @patch("google.genai.Client")
+    def test_get_or_create_store_drops_persisted_deleted_store(self, MockClient):
+        # Arrange
+        mock_client_instance = MockClient()
+        mock_store = MagicMock()
+        mock_store.display_name = "cached_store"
+        mock_store.name = "fileSearchStores/cached_store_789"
+        mock_client_instance.file_search_stores.list.side_effect = [[mock_store], []]
+        mock_client_instance.file_search_stores.create.return_value.name = (
+            "fileSearchStores/cached_store_new"
+        )
+        get_or_create_store(mock_client_instance, "cached_store")
+        self._restart_store_cache()
+        mock_client_instance.file_search_stores.get.side_effect = (
+            genai_errors.ClientError(404, {"error": {"status": "NOT_FOUND"}})
+        )
+
+        # Act
+        result = get_or_create_store(mock_client_instance, "cached_store")
+
+        # Assert
+        self.assertEqual(result, "fileSearchStores/cached_store_new")
+        self.assertEqual(mock_client_instance.file_search_stores.list.call_count, 2)
+
+    @patch("google.genai.Client")
+    def test_get_or_create_store_respects_concurrent_forget(self, MockClient):
+        # Arrange
+        mock_client_instance = MockClient()
+        mock_store = MagicMock()
+        mock_store.display_name = "cached_store"
+        mock_store.name = "fileSearchStores/cached_store_789"
+        mock_client_instance.file_search_stores.list.return_value = [mock_store]
+        get_or_create_store(mock_client_instance, "cached_store")
+        self._restart_store_cache()
+
+        def store_deleted_during_check(client, store_name):
+            file_search_service._forget_store_name(store_name)
+            return True
+
+        # Act
+        with patch.object(
+            file_search_service, "_store_exists", store_deleted_during_check
+        ):
+            get_or_create_store(mock_client_instance, "cached_store")
+
+        # Assert: the forgotten name was re-resolved, not re-marked as verified
+        self.assertEqual(mock_client_instance.file_search_stores.list.call_count, 2)
+
+    def test_get_or_create_store_cache_is_per_api_key(self):
+        # Arrange
+        clients = [MagicMock(), MagicMock()]
+        for api_key, client in zip(["key-a", "key-b"], clients):
+            client._api_client.api_key = api_key
+            store = MagicMock()
+            store.display_name = "shared_name"
+            store.name = f"fileSearchStores/{api_key}"
+            client.file_search_stores.list.return_value = [store]
+
+        # Act
+        names = [get_or_create_store(client, "shared_name") for client in clients]
+
+        # Assert
+        self.assertEqual(names, ["fileSearchStores/key-a", "fileSearchStores/key-b"])
+        for client in clients:
+            client.file_search_stores.list.assert_called_once()
+
+    def _restart_store_cache(self):
+        """Reload the store name cache from disk as a fresh process would."""
+        file_search_service._STORE_NAME_CACHE.clear()
+        file_search_service._VERIFIED_STORE_NAMES.clear()
+        file_search_service._STORE_NAME_CACHE.update(
+            file_search_service._load_store_cache()
+        )
+
+    def test_load_store_cache_ignores_corrupt_file(self):
+        with open(file_search_service.STORE_CACHE_PATH, "w") as fh:
+            fh.write("{not json")
+
+        self.assertEqual(file_search_service._load_store_cache(), {})
+
+    @patch("google.genai.Client")
+    def test_clear_store_invalidates_store_cache(self, MockClient):
+        # Arrange
+        mock_client_instance = MockClient()
+        mock_store = MagicMock()
+        mock_store.display_name = "cached_store"
+        mock_store.name = "fileSearchStores/cached_store_789"
+        mock_client_instance.file_search_stores.list.return_value = [mock_store]
+        get_or_create_store(mock_client_instance, "cached_store")
+
+        # Act
+        result = clear_store(mock_client_instance, "fileSearchStores/cached_store_789")
+        get_or_create_store(mock_client_instance, "cached_store")
+
+        # Assert
+        self.assertTrue(result.deleted)
+        self.assertEqual(mock_client_instance.file_search_stores.list.call_count, 2)
+
     @patch("google.genai.Client")
     def test_document_exists(self, MockClient):
         # Arrange
@@ -61,6 +230,113 @@ class TestFileSearchService(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result.display_name, "existing_doc.pdf")
 
+    @patch("google.genai.Client")
+    def test_document_exists_lists_store_once(self, MockClient):
+        # Arrange
+        mock_client_instance = MockClient()
+        mock_doc = MagicMock()
+        mock_doc.display_name = "existing_doc.pdf"
+        mock_doc.name = "fileSearchStores/store/documents/doc1"
+        mock_client_instance.file_search_stores.documents.list.return_value = [mock_doc]
+
+        # Act
+        first = document_exists(mock_client_instance, "store_name", "existing_doc.pdf")
+        second = document_exists(mock_client_instance, "store_name", "other_doc.pdf")
+
+        # Assert
+        self.assertIsNotNone(first)
+        self.assertIsNone(second)
+        mock_client_instance.file_search_stores.documents.list.assert_called_once()
+
+    @patch("google.genai.Client")
+    def test_document_exists_retries_after_list_failure(self, MockClient):
+        # Arrange
+        mock_client_instance = MockClient()
+        mock_doc = MagicMock()
+        mock_doc.display_name = "existing_doc.pdf"
+        mock_client_instance.file_search_stores.documents.list.side_effect = [
+            Exception("503 UNAVAILABLE"),
+            [mock_doc],
+        ]
+
+        # Act
+        with self.assertLogs(file_search_service.logger, level="DEBUG"):
+            first = document_exists(
+                mock_client_instance, "store_name", "existing_doc.pdf"
+            )
+        second = document_exists(mock_client_instance, "store_name", "existing_doc.pdf")
+
+        # Assert: the failed listing is logged and not cached
+        self.assertIsNone(first)
+        self.assertIsNotNone(second)
+
+    @patch("google.genai.Client")
+    def test_delete_document_updates_index(self, MockClient):
+        # Arrange
+        mock_client_instance = MockClient()
+        mock_doc = MagicMock()
+        mock_doc.display_name = "existing_doc.pdf"
+        mock_doc.name = "fileSearchStores/store/documents/doc1"
+        mock_client_instance.file_search_stores.documents.list.return_value = [mock_doc]
+
+        # Act
+        deleted = delete_document(mock_client_instance, "store_name", "existing_doc.pdf")
+        result = document_exists(mock_client_instance, "store_name", "existing_doc.pdf")
+
+        # Assert
+        self.assertTrue(deleted)
+        self.assertIsNone(result)
+        mock_client_instance.file_search_stores.documents.delete.assert_called_once_with(
+            name="fileSearchStores/store/documents/doc1", config={"force": True}
+        )
+
+    @patch("google.genai.Client")
+    def test_list_store_documents_raises_transient_errors(self, MockClient):
+        # Arrange
+        mock_client_instance = MockClient()
+        documents = mock_client_instance.file_search_stores.documents
+        documents.list.side_effect = genai_errors.ServerError(
+            503, {"error": {"status": "UNAVAILABLE"}}
+        )
+
+        # Act / Assert: not reported as an empty store
+        with self.assertRaises(genai_errors.ServerError):
+            list_store_documents(mock_client_instance, "store_name")
+
+    @patch("code.file_search_service._forget_store_name")
+    @patch("google.genai.Client")
+    def test_list_store_documents_forgets_missing_store(self, MockClient, mock_forget):
+        # Arrange
+        mock_client_instance = MockClient()
+        documents = mock_client_instance.file_search_stores.documents
+        documents.list.side_effect = genai_errors.ClientError(
+            404, {"error": {"status": "NOT_FOUND"}}
+        )
+
+        # Act
+        result = list_store_documents(mock_client_instance, "store_name")
+
+        # Assert
+        self.assertEqual(result, [])
+        mock_forget.assert_called_once_with("store_name")
+
+    @patch("google.genai.Client")
+    def test_list_store_documents_keeps_state_enum(self, MockClient):
+        # Arrange
+        mock_client_instance = MockClient()
+        mock_doc = MagicMock()
+        mock_doc.display_name = "existing_doc.pdf"
+        mock_doc.name = "fileSearchStores/store/documents/doc1"
+        mock_doc.state = types.DocumentState.STATE_ACTIVE
+        mock_client_instance.file_search_stores.documents.list.return_value = [mock_doc]
+
+        # Act
+        documents = list_store_documents(mock_client_instance, "store_name")
+
+        # Assert
+        self.assertIs(documents[0].state, types.DocumentState.STATE_ACTIVE)
+        self.assertEqual(documents[0].state_name, "STATE_ACTIVE")
+
     @patch("google.genai.Client")
     def test_document_does_not_exist(self, MockClient):
         # Arrange
@@ -120,6 +396,394 @@ class TestFileSearchService(unittest.TestCase):
         self.assertTrue(result.success)
         self.assertEqual(result.file_name, "test.pdf")
 
+    @patch("code.file_search_service.time.sleep")
+    @patch("google.genai.Client")
+    def test_upload_single_file_skips_polling_when_done(self, MockClient, mock_sleep):
+        # Arrange
+        mock_client_instance = MockClient()
+        mock_operation = MagicMock(done=True, error=None, metadata=None)
+        mock_operation.name = None
+        mock_operation.response.document_name = "stores/store/documents/doc1"
+        mock_client_instance.file_search_stores.upload_to_file_search_store.return_value = (
+            mock_operation
+        )
+
+        upload = io.BytesIO(b"hello")
+        upload.name = "hello.txt"
+
+        # Act
+        result = upload_single_file(mock_client_instance, "store_name", upload)
+
+        # Assert
+        self.assertTrue(result.success)
+        mock_sleep.assert_not_called()
+        mock_client_instance.operations.get.assert_not_called()
+
+    @patch("google.genai.Client")
+    def test_upload_single_file_dedupes_identical_content(self, MockClient):
+        # Arrange
+        mock_client_instance = MockClient()
+        mock_operation = MagicMock(done=True, error=None)
+        mock_operation.response.document_name = "stores/store/documents/doc1"
+        upload_to_store = (
+            mock_client_instance.file_search_stores.upload_to_file_search_store
+        )
+        upload_to_store.return_value = mock_operation
+        mock_client_instance.file_search_stores.documents.get.return_value = (
+            MagicMock(state=types.DocumentState.STATE_ACTIVE)
+        )
+        first = io.BytesIO(b"same bytes")
+        first.name = "report.pdf"
+        second = io.BytesIO(b"same bytes")
+        second.name = "report (1).pdf"
+
+        # Act
+        upload_single_file(mock_client_instance, "store_name", first)
+        result = upload_single_file(mock_client_instance, "store_name", second)
+
+        # Assert
+        self.assertTrue(result.success)
+        self.assertTrue(result.deduped)
+        upload_to_store.assert_called_once()
+        mock_client_instance.file_search_stores.documents.get.assert_called_once_with(
+            name="stores/store/documents/doc1"
+        )
+
+    @patch("google.genai.Client")
+    def test_upload_single_file_reuploads_when_deduped_document_is_gone(
+        self, MockClient
+    ):
+        # Arrange
+        mock_client_instance = MockClient()
+        mock_operation = MagicMock(done=True, error=None)
+        mock_operation.response.document_name = "stores/store/documents/doc2"
+        upload_to_store = (
+            mock_client_instance.file_search_stores.upload_to_file_search_store
+        )
+        upload_to_store.return_value = mock_operation
+        mock_client_instance.file_search_stores.documents.get.side_effect = Exception(
+            "404 NOT_FOUND"
+        )
+        content_hash = file_search_service._hash_upload_source(
+            io.BytesIO(b"same bytes")
+        )
+        file_search_service._remember_content(
+            "store_name", content_hash, "stores/store/documents/doc1"
+        )
+        upload = io.BytesIO(b"same bytes")
+        upload.name = "report.pdf"
+
+        # Act
+        result = upload_single_file(mock_client_instance, "store_name", upload)
+
+        # Assert
+        self.assertTrue(result.success)
+        self.assertFalse(result.deduped)
+        upload_to_store.assert_called_once()
+        self.assertEqual(
+            file_search_service._lookup_content("store_name", content_hash),
+            "stores/store/documents/doc2",
+        )
+
+    def test_load_content_index_drops_expired_entries(self):
+        # Arrange
+        now = time.time()
+        expired = now - file_search_service.CONTENT_INDEX_TTL_SECONDS - 1
+        with open(file_search_service.CONTENT_INDEX_PATH, "w") as fh:
+            json.dump(
+                {
+                    "live_store": {"h1": ["docs/a", now], "h2": ["docs/b", expired]},
+                    "deleted_store": {"h3": ["docs/c", expired]},
+                },
+                fh,
+            )
+
+        # Act
+        index = file_search_service._load_content_index()
+
+        # Assert
+        self.assertEqual(index, {"live_store": {"h1": ("docs/a", now)}})
+
+    @patch("code.file_search_service.tempfile.NamedTemporaryFile")
+    @patch("google.genai.Client")
+    def test_upload_single_file_streams_io_without_temp_file(
+        self, MockClient, MockNamedTemporaryFile
+    ):
+        # Arrange
+        mock_client_instance = MockClient()
+        uploaded_file = io.BytesIO(b"file content")
+        uploaded_file.name = "notes.txt"
+        uploaded_file.type = "text/plain"
+        uploaded_file.read()  # Leave the stream positioned at the end
+
+        mock_operation = MagicMock()
+        mock_operation.name = "operations/123"
+        mock_operation.done = True
+        mock_operation.error = None
+        mock_operation.response = None
+        mock_client_instance.file_search_stores.upload_to_file_search_store.return_value = (
+            mock_operation
+        )
+
+        # Act
+        result = upload_single_file(mock_client_instance, "store_name", uploaded_file)
+
+        # Assert
+        self.assertTrue(result.success)
+        MockNamedTemporaryFile.assert_not_called()
+        call = mock_client_instance.file_search_stores.upload_to_file_search_store.call_args
+        self.assertIs(call.kwargs["file"], uploaded_file)
+        self.assertEqual(uploaded_file.tell(), 0)
+
+    @patch("google.genai.Client")
+    def test_upload_if_absent_skips_active_document(self, MockClient):
+        # Arrange
+        mock_client_instance = MockClient()
+        mock_doc = MagicMock()
+        mock_doc.display_name = "existing_doc.pdf"
+        mock_doc.name = "fileSearchStores/store/documents/doc1"
+        mock_doc.state = types.DocumentState.STATE_ACTIVE
+        mock_client_instance.file_search_stores.documents.list.return_value = [mock_doc]
+        mock_uploaded_file = MagicMock()
+        mock_uploaded_file.name = "existing_doc.pdf"
+
+        # Act
+        result = upload_if_absent(
+            mock_client_instance, "store_name", mock_uploaded_file
+        )
+
+        # Assert
+        self.assertTrue(result.success)
+        self.assertTrue(result.skipped)
+        mock_client_instance.file_search_stores.upload_to_file_search_store.assert_not_called()
+
+    @patch("code.file_search_service.upload_single_file")
+    @patch("google.genai.Client")
+    def test_upload_files_batch_preserves_order(self, MockClient, MockUpload):
+        # Arrange
+        mock_client_instance = MockClient()
+        files = []
+        for name in ("a.pdf", "b.txt", "c.pdf"):
+            uploaded_file = MagicMock()
+            uploaded_file.name = name
+            files.append(uploaded_file)
+        MockUpload.side_effect = lambda client, store, uploaded_file: UploadResult(
+            file_name=uploaded_file.name, success=True
+        )
+
+        # Act
+        results = upload_files_batch(mock_client_instance, "store_name", files)
+
+        # Assert
+        self.assertEqual([r.file_name for r in results], ["a.pdf", "b.txt", "c.pdf"])
+        self.assertEqual(MockUpload.call_count, 3)
+
+    @patch("code.file_search_service.upload_single_file")
+    @patch("google.genai.Client")
+    def test_upload_files_parallel_yields_all_results(self, MockClient, MockUpload):
+        # Arrange
+        mock_client_instance = MockClient()
+        files = []
+        for name in ("a.pdf", "b.txt"):
+            uploaded_file = MagicMock()
+            uploaded_file.name = name
+            files.append(uploaded_file)
+        MockUpload.side_effect = lambda client, store, uploaded_file: UploadResult(
+            file_name=uploaded_file.name, success=True
+        )
+
+        # Act
+        results = list(
+            upload_files_parallel(mock_client_instance, "store_name", files)
+        )
+
+        # Assert
+        self.assertCountEqual([r.file_name for r in results], ["a.pdf", "b.txt"])
+
+    @patch("code.file_search_service.upload_single_file")
+    @patch("google.genai.Client")
+    def test_upload_files_parallel_uses_given_executor(self, MockClient, MockUpload):
+        # Arrange
+        mock_client_instance = MockClient()
+        uploaded_file = MagicMock()
+        uploaded_file.name = "a.pdf"
+        MockUpload.side_effect = RuntimeError("boom")
+        status_callback = MagicMock()
+
+        # Act
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            results = list(
+                upload_files_parallel(
+                    mock_client_instance,
+                    "store_name",
+                    [uploaded_file],
+                    executor=executor,
+                    status_callback=status_callback,
+                )
+            )
+            # The caller's pool is left running for the next batch
+            self.assertFalse(executor._shutdown)
+
+        # Assert: worker exceptions become failed results
+        self.assertEqual(len(results), 1)
+        self.assertFalse(results[0].success)
+        self.assertIn("boom", results[0].error_message)
+        status_callback.assert_called()
+
+    @patch("code.file_search_service.asyncio.sleep", new_callable=AsyncMock)
+    @patch("google.genai.Client")
+    def test_upload_many_async_polls_without_blocking(self, MockClient, mock_sleep):
+        # Arrange
+        mock_client_instance = MockClient()
+        pending = MagicMock()
+        pending.name = "operations/123"
+        pending.done = False
+        finished = MagicMock()
+        finished.name = "operations/123"
+        finished.done = True
+        finished.error = None
+        finished.response.document_name = "stores/store/documents/doc1"
+        mock_client_instance.aio.file_search_stores.upload_to_file_search_store = (
+            AsyncMock(return_value=pending)
+        )
+        mock_client_instance.aio.operations.get = AsyncMock(return_value=finished)
+
+        files = []
+        for name in ("a.txt", "b.txt"):
+            uploaded_file = io.BytesIO(b"content")
+            uploaded_file.name = name
+            uploaded_file.type = "text/plain"
+            files.append(uploaded_file)
+
+        # Act
+        results = asyncio.run(
+            upload_many_async(mock_client_instance, "store_name", files)
+        )
+
+        # Assert
+        self.assertEqual([r.file_name for r in results], ["a.txt", "b.txt"])
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual(mock_client_instance.aio.operations.get.await_count, 2)
+        self.assertEqual(mock_sleep.await_count, 2)
+
+    @patch("code.file_search_service.time.sleep")
+    def test_poll_schedule_slices_long_waits_for_status_updates(self, mock_sleep):
+        # Arrange
+        status_callback = MagicMock()
+        schedule = file_search_service._PollSchedule(60, status_callback)
+        schedule.wait_time = 25
+        schedule.next_status_at = schedule.start
+
+        # Act
+        waited = schedule.wait()
+
+        # Assert
+        self.assertTrue(waited)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [10, 10, 5])
+        status_callback.assert_called()
+
+    @patch("code.file_search_service.random.uniform", return_value=0.25)
+    @patch("code.file_search_service.time.monotonic")
+    def test_poll_schedule_uses_reported_progress(self, mock_time, mock_uniform):
+        # Arrange: 25% done after 20s predicts 60s left
+        mock_time.return_value = 1000.0
+        schedule = file_search_service._PollSchedule(900)
+        mock_time.return_value = 1020.0
+        operation = MagicMock(metadata={"progressPercent": 25})
+
+        # Act
+        delay = schedule.next_delay(operation)
+
+        # Assert: half the predicted remainder plus jitter; backoff untouched
+        self.assertEqual(delay, 30.25)
+        self.assertEqual(schedule.wait_time, 5)
+
+    @patch("code.file_search_service.time.monotonic")
+    def test_poll_schedule_stops_at_deadline(self, mock_monotonic):
+        mock_monotonic.return_value = 500.0
+        schedule = file_search_service._PollSchedule(60)
+
+        mock_monotonic.return_value = 560.0
+        self.assertEqual(schedule.next_delay(), 5)
+        mock_monotonic.return_value = 560.5
+        self.assertIsNone(schedule.next_delay())
+
+    def test_poll_schedule_falls_back_to_backoff_without_progress(self):
+        schedule = file_search_service._PollSchedule(900)
+
+        delays = [schedule.next_delay(MagicMock(metadata=None)) for _ in range(3)]
+
+        self.assertEqual(delays, [5, 10, 20])
+
+    @patch("google.genai.Client")
+    def test_upload_single_file_streams_readable_object_to_temp_file(
+        self, MockClient
+    ):
+        # Arrange
+        mock_client_instance = MockClient()
+
+        class ReadableUpload:
+            name = "notes.txt"
+            type = "text/plain"
+
+            def __init__(self, data):
+                self._stream = io.BytesIO(data)
+                self.read = self._stream.read
+                self.seek = self._stream.seek
+
+        uploaded_file = ReadableUpload(b"x" * ((1 << 20) + 7))
+        staged = {}
+
+        def fake_upload(file, file_search_store_name, config):
+            with open(file, "rb") as fh:
+                staged["data"] = fh.read()
+            operation = MagicMock()
+            operation.name = "operations/123"
+            operation.done = True
+            operation.error = None
+            operation.response = None
+            return operation
+
+        mock_client_instance.file_search_stores.upload_to_file_search_store.side_effect = (
+            fake_upload
+        )
+
+        # Act
+        result = upload_single_file(mock_client_instance, "store_name", uploaded_file)
+
+        # Assert
+        self.assertTrue(result.success)
+        self.assertEqual(staged["data"], b"x" * ((1 << 20) + 7))
+
+    @patch("code.file_search_service.tempfile.NamedTemporaryFile")
+    @patch("google.genai.Client")
+    def test_upload_single_file_wraps_in_memory_bytes(
+        self, MockClient, MockNamedTemporaryFile
+    ):
+        # Arrange
+        mock_client_instance = MockClient()
+        uploaded_file = MagicMock(spec=["name", "type", "getvalue"])
+        uploaded_file.name = "test.pdf"
+        uploaded_file.type = "application/pdf"
+        uploaded_file.getvalue.return_value = b"file content"
+        mock_operation = MagicMock()
+        mock_operation.name = "operations/123"
+        mock_operation.done = True
+        mock_operation.error = None
+        mock_operation.response = None
+        mock_client_instance.file_search_stores.upload_to_file_search_store.return_value = (
+            mock_operation
+        )
+
+        # Act
+        result = upload_single_file(mock_client_instance, "store_name", uploaded_file)
+
+        # Assert
+        self.assertTrue(result.success)
+        MockNamedTemporaryFile.assert_not_called()
+        call = mock_client_instance.file_search_stores.upload_to_file_search_store.call_args
+        self.assertEqual(call.kwargs["file"].getvalue(), b"file content")
+
 
 if __name__ == "__main__":
     unittest.main()